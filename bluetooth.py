@@ -1,6 +1,7 @@
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.components import bluetooth
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from bleak import BleakClient
 from bleak.exc import BleakError
 from datetime import timedelta
@@ -8,91 +9,137 @@ import asyncio
 
 from .const import (
     DOMAIN,
+    CONF_TRIGGER_COMMAND,
+    CONF_FALLBACK_PROBED,
+    CONF_DATA_CHARACTERISTIC,
     NOTIFY_CHARACTERISTIC_UUID,
     WRITE_CHARACTERISTIC_UUID,
     CONTROLLER_REALDATA_CMD,
-    CONTROLLER_REALDATA_WITH_CRC_CMD,
-    NEW_DEVICE_REALDATA_CMD,
-    OLD_DEVICE_REALDATA_CMD,
+    TRIGGER_COMMANDS,
     MIN_DATA_LENGTH,
     RESPONSE_TIMEOUT,
+    MAX_MISSED_RESPONSES,
     CONNECTION_TIMEOUT,
     UPDATE_INTERVAL,
+    DISPATCH_MIN_INTERVAL,
+    RECONNECT_BACKOFF_INITIAL,
+    RECONNECT_BACKOFF_MAX,
+    RSSI_EMA_ALPHA,
+    DIAGNOSTICS_CACHE_TTL,
 )
 import logging
 import struct
+import time
 
 _LOGGER = logging.getLogger(__name__)
 
-def parse_mppt_packet(data: bytes) -> dict:
-    """Parse MPPT data packet from Bluetooth notification."""
-    if len(data) < MIN_DATA_LENGTH:
-        raise ValueError(f"Data too short: expected at least {MIN_DATA_LENGTH} bytes, got {len(data)}")
-    
-    # Parse MPPT data using confirmed byte offsets
-    # Basic readings
-    battery_volt_raw = int.from_bytes(data[5:7], "big")
-    battery_current_raw = int.from_bytes(data[7:9], "big")
-    battery_temp_raw = data[10]
-    
-    solar_volt_raw = int.from_bytes(data[17:19], "big")
-    solar_current_raw = int.from_bytes(data[19:21], "big")
-    solar_power_raw = int.from_bytes(data[21:23], "big")
-    
-    # Additional data fields from JavaScript analysis
-    # Load/output data (if available)
-    load_volt_raw = int.from_bytes(data[11:13], "big") if len(data) > 13 else 0
-    load_current_raw = int.from_bytes(data[13:15], "big") if len(data) > 15 else 0
-    load_power_raw = int.from_bytes(data[15:17], "big") if len(data) > 17 else 0
-    
-    # Status and state information
-    charging_state = data[23] if len(data) > 23 else 0
-    error_code = data[24] if len(data) > 24 else 0
+# Command payloads decoded once at import, keyed by their hex form
+_COMMAND_BYTES = {cmd_hex: bytes.fromhex(cmd_hex) for cmd_hex in TRIGGER_COMMANDS}
+
+# Fixed MPPT packet layout (big-endian), starting at byte offset 5:
+# battery volt/current, pad, battery temp, load volt/current/power,
+# solar volt/current/power, charging state, error code, daily energy,
+# total energy (32-bit), max solar volt, max battery volt, max charging current.
+# Trailing pad bytes, derived from MIN_DATA_LENGTH, extend the layout so
+# unpack_from rejects short packets on its own.
+_MPPT_FIELDS = ">HHxBHHHHHHBBHIHHH"
+_MPPT_OFFSET = 5
+_MPPT_STRUCT = struct.Struct(
+    f"{_MPPT_FIELDS}{MIN_DATA_LENGTH - _MPPT_OFFSET - struct.calcsize(_MPPT_FIELDS)}x"
+)
+
+# Keys of the parsed reading, in the order parse_mppt_packet emits the values
+_MPPT_KEYS = (
+    "solar_voltage",
+    "solar_current",
+    "solar_power",
+    "battery_voltage",
+    "battery_current",
+    "battery_temperature",
+    "load_voltage",
+    "load_current",
+    "load_power",
+    "charging_state",
+    "error_code",
+    "daily_energy",
+    "total_energy",
+    "max_solar_voltage",
+    "max_battery_voltage",
+    "max_charging_current",
+)
+
+def parse_mppt_packet(data: bytes, /) -> dict:
+    """Parse MPPT data packet from Bluetooth notification.
+
+    Accepts any buffer-protocol object (bytes, bytearray, memoryview);
+    fields are read in place without copying.
+    """
+    # Decode every field in a single pass using the precompiled layout
+    try:
+        fields = _MPPT_STRUCT.unpack_from(data, _MPPT_OFFSET)
+    except struct.error as e:
+        raise ValueError(f"Data too short: expected at least {MIN_DATA_LENGTH} bytes, got {len(data)}") from e
     
-    # Daily statistics (if available in longer packets)
-    daily_energy_raw = int.from_bytes(data[25:27], "big") if len(data) > 27 else 0
-    total_energy_raw = int.from_bytes(data[27:31], "big") if len(data) > 31 else 0
+    # Every data frame is a Modbus "read holding registers" (0x03) reply from device address 0xFF;
+    # index the two bytes rather than slicing (unpack_from above already ensured the length)
+    if data[0] != 0xFF or data[1] != 0x03:
+        raise ValueError(f"Unexpected packet header: {bytes(data[:2]).hex()}")
     
-    # Maximum values recorded
-    max_solar_volt_raw = int.from_bytes(data[31:33], "big") if len(data) > 33 else solar_volt_raw
-    max_battery_volt_raw = int.from_bytes(data[33:35], "big") if len(data) > 35 else battery_volt_raw
-    max_charging_current_raw = int.from_bytes(data[35:37], "big") if len(data) > 37 else battery_current_raw
+    (
+        battery_volt_raw,
+        battery_current_raw,
+        battery_temp_raw,
+        load_volt_raw,
+        load_current_raw,
+        load_power_raw,
+        solar_volt_raw,
+        solar_current_raw,
+        solar_power_raw,
+        charging_state,
+        error_code,
+        daily_energy_raw,
+        total_energy_raw,
+        max_solar_volt_raw,
+        max_battery_volt_raw,
+        max_charging_current_raw,
+    ) = fields
 
-    parsed_data = {
+    parsed_data = dict(zip(_MPPT_KEYS, (
         # Basic MPPT readings
-        "solar_voltage": round(solar_volt_raw * 0.1, 2),
-        "solar_current": round(solar_current_raw * 0.01, 2),
-        "solar_power": solar_power_raw,
-        "battery_voltage": round(battery_volt_raw * 0.1, 2),
-        "battery_current": round(battery_current_raw * 0.01, 2),
-        "battery_temperature": round(float(battery_temp_raw), 1),
+        solar_volt_raw / 10,
+        solar_current_raw / 100,
+        solar_power_raw,
+        battery_volt_raw / 10,
+        battery_current_raw / 100,
+        float(battery_temp_raw),
         
         # Load/output readings
-        "load_voltage": round(load_volt_raw * 0.1, 2),
-        "load_current": round(load_current_raw * 0.01, 2),
-        "load_power": load_power_raw,
+        load_volt_raw / 10,
+        load_current_raw / 100,
+        load_power_raw,
         
         # Status information
-        "charging_state": charging_state,
-        "error_code": error_code,
+        charging_state,
+        error_code,
         
         # Energy statistics
-        "daily_energy": round(daily_energy_raw * 0.01, 2),  # kWh
-        "total_energy": round(total_energy_raw * 0.01, 2),  # kWh
+        daily_energy_raw / 100,  # kWh
+        total_energy_raw / 100,  # kWh
         
         # Maximum values
-        "max_solar_voltage": round(max_solar_volt_raw * 0.1, 2),
-        "max_battery_voltage": round(max_battery_volt_raw * 0.1, 2),
-        "max_charging_current": round(max_charging_current_raw * 0.01, 2),
-    }
+        max_solar_volt_raw / 10,
+        max_battery_volt_raw / 10,
+        max_charging_current_raw / 100,
+    )))
     
-    # Enhanced logging with additional data
-    _LOGGER.info("MPPT Data - HEX: %s | Solar: %.1fV/%.2fA/%dW | Battery: %.1fV/%.2fA/%.1f°C | Load: %.1fV/%.2fA/%dW | State: %d | Daily: %.2fkWh", 
-                data.hex(), 
-                parsed_data["solar_voltage"], parsed_data["solar_current"], parsed_data["solar_power"],
-                parsed_data["battery_voltage"], parsed_data["battery_current"], parsed_data["battery_temperature"],
-                parsed_data["load_voltage"], parsed_data["load_current"], parsed_data["load_power"],
-                parsed_data["charging_state"], parsed_data["daily_energy"])
+    # Enhanced logging with additional data (runs for every packet, so skip the hex dump unless debugging)
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("MPPT Data - HEX: %s | Solar: %.1fV/%.2fA/%dW | Battery: %.1fV/%.2fA/%.1f°C | Load: %.1fV/%.2fA/%dW | State: %d | Daily: %.2fkWh",
+                    data.hex(),
+                    parsed_data["solar_voltage"], parsed_data["solar_current"], parsed_data["solar_power"],
+                    parsed_data["battery_voltage"], parsed_data["battery_current"], parsed_data["battery_temperature"],
+                    parsed_data["load_voltage"], parsed_data["load_current"], parsed_data["load_power"],
+                    parsed_data["charging_state"], parsed_data["daily_energy"])
     
     return parsed_data
 
@@ -104,21 +151,55 @@ class MPPTBLECoordinator(DataUpdateCoordinator):
         self._mac_address = entry.data["mac_address"].upper()
         self._entry = entry
         self._client = None
+        self._notify_char = None
+        self._write_char = None
+        self._trigger_command = entry.data.get(CONF_TRIGGER_COMMAND)
+        if self._trigger_command not in _COMMAND_BYTES:
+            # Not learned yet, or stored by a version with a different command set; probe again
+            self._trigger_command = None
+        self._probed_once = entry.data.get(CONF_FALLBACK_PROBED, False)
+        self._data_char_uuid = entry.data.get(CONF_DATA_CHARACTERISTIC)
         self._latest_data = None
+        self._last_raw = None
+        self._rssi_ema = None
+        self._missed_responses = 0
+        self._reconnect_backoff = 0.0
+        self._connect_skips = 0
+        self._device_missing = False
+        self._diagnostics = None
+        self._diagnostics_updated = 0.0
+        self._last_dispatch = 0.0
+        self._dispatch_handle = None
         self._notification_received = asyncio.Event()
         
+        # Shared by every sensor of this device
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=entry.data["name"],
+            manufacturer="VEVOR",
+            model="MPPT Bluetooth Charger",
+            connections={("mac", entry.data["mac_address"])},
+        )
+        
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=UPDATE_INTERVAL),
+            # Readings are plain dicts, so an unchanged poll compares equal and skips the sensor writes
+            always_update=False,
         )
         
-        _LOGGER.info("Initializing MPPT BLE Coordinator for MAC address: %s", self._mac_address)
-        _LOGGER.info("Using notification-based approach")
+        _LOGGER.debug("Initializing MPPT BLE Coordinator for MAC address: %s", self._mac_address)
+        _LOGGER.debug("Using notification-based approach")
 
     def _get_bluetooth_diagnostics(self) -> dict:
         """Get Bluetooth diagnostic information."""
+        # Reuse a recent lookup rather than querying the Bluetooth integration on every notification
+        now = time.monotonic()
+        if self._diagnostics is not None and now - self._diagnostics_updated < DIAGNOSTICS_CACHE_TTL:
+            return self._diagnostics
+        
         diagnostics = {
             "link_quality": None,
             "signal_strength": None,
@@ -126,55 +207,119 @@ class MPPTBLECoordinator(DataUpdateCoordinator):
         
         try:
             # Get RSSI from Home Assistant's Bluetooth integration
-            from homeassistant.components.bluetooth import async_last_service_info
-            
-            service_info = async_last_service_info(self.hass, self._mac_address, connectable=True)
+            service_info = bluetooth.async_last_service_info(self.hass, self._mac_address, connectable=True)
             
             if service_info and hasattr(service_info, 'advertisement') and service_info.advertisement.rssi is not None:
                 # RSSI (Received Signal Strength Indicator) in dBm
                 rssi = service_info.advertisement.rssi
                 diagnostics["signal_strength"] = rssi
                 
-                # Calculate link quality percentage based on RSSI
-                # RSSI typically ranges from -30 (excellent) to -90 (poor)
-                # Convert to 0-100% scale
-                if rssi >= -30:
-                    link_quality = 100
-                elif rssi <= -90:
-                    link_quality = 0
+                # Smooth RSSI with an exponential moving average so link quality doesn't jitter
+                if self._rssi_ema is None:
+                    self._rssi_ema = rssi
                 else:
-                    # Linear interpolation between -30 and -90 dBm
-                    link_quality = int(((rssi + 90) / 60) * 100)
+                    self._rssi_ema = RSSI_EMA_ALPHA * rssi + (1 - RSSI_EMA_ALPHA) * self._rssi_ema
+                rssi = self._rssi_ema
                 
-                diagnostics["link_quality"] = max(0, min(100, link_quality))
+                # Calculate link quality percentage based on RSSI
+                # RSSI typically ranges from -30 (excellent) to -90 (poor)
+                # Convert to 0-100% scale by linear interpolation, clamped outside that range
+                diagnostics["link_quality"] = max(0, min(100, int((rssi + 90) * 100 // 60)))
                 
         except Exception as e:
             _LOGGER.debug("Could not get Bluetooth diagnostics: %s", e)
             
+        self._diagnostics = diagnostics
+        self._diagnostics_updated = now
         return diagnostics
 
+    def _store_entry_value(self, key: str, value) -> None:
+        """Persist a learned device detail in the config entry so it survives restarts."""
+        if self._entry.data.get(key) == value:
+            return
+        
+        _LOGGER.debug("Storing %s=%s for device %s", key, value, self._mac_address)
+        self.hass.config_entries.async_update_entry(
+            self._entry, data={**self._entry.data, key: value}
+        )
+
+    def _mark_probed(self) -> None:
+        """Record that the one-time characteristic probe has completed."""
+        self._probed_once = True
+        self._store_entry_value(CONF_FALLBACK_PROBED, True)
+
+    async def _read_data_characteristic(self) -> dict | None:
+        """Read MPPT data from the characteristic found by the one-time probe."""
+        try:
+            data = await self._client.read_gatt_char(self._data_char_uuid)
+            parsed_data = parse_mppt_packet(data)
+        except Exception as e:
+            _LOGGER.debug("Failed to read MPPT data from %s: %s", self._data_char_uuid, e)
+            return None
+        
+        parsed_data.update(self._get_bluetooth_diagnostics())
+        self._latest_data = parsed_data
+        return parsed_data
+
+    def _schedule_dispatch(self) -> None:
+        """Push the latest reading to the sensors, at most once per DISPATCH_MIN_INTERVAL."""
+        if self._dispatch_handle is not None:
+            return  # Already scheduled; it will pick up the newest reading
+        
+        elapsed = time.monotonic() - self._last_dispatch
+        if elapsed >= DISPATCH_MIN_INTERVAL:
+            self._dispatch_latest()
+        else:
+            self._dispatch_handle = self.hass.loop.call_later(
+                DISPATCH_MIN_INTERVAL - elapsed, self._dispatch_latest
+            )
+
+    @callback
+    def _dispatch_latest(self) -> None:
+        """Hand the latest reading to the coordinator listeners."""
+        self._dispatch_handle = None
+        if self._latest_data is None:
+            return  # Reset by a reconnect since this was scheduled
+        
+        self._last_dispatch = time.monotonic()
+        self.async_set_updated_data(self._latest_data)
+
+    def _cancel_dispatch(self) -> None:
+        """Drop a scheduled dispatch of the latest reading."""
+        if self._dispatch_handle is not None:
+            self._dispatch_handle.cancel()
+            self._dispatch_handle = None
+
+    def _back_off_reconnect(self) -> None:
+        """Double the wait after each failed connection attempt, up to RECONNECT_BACKOFF_MAX seconds."""
+        self._reconnect_backoff = min(self._reconnect_backoff * 2 or RECONNECT_BACKOFF_INITIAL, RECONNECT_BACKOFF_MAX)
+        self._connect_skips = int(self._reconnect_backoff // UPDATE_INTERVAL)
+
+    def _handle_disconnect(self, client) -> None:
+        """Reconnect promptly when the device drops the connection on its own."""
+        if client is not self._client:
+            # We disconnected on purpose (reconnect, error handling or shutdown)
+            return
+        
+        _LOGGER.info("MPPT device %s disconnected, requesting reconnect", self._mac_address)
+        self._notify_char = None
+        self._write_char = None
+        self.hass.async_create_task(self.async_request_refresh())
+
     async def _send_data_request_command(self):
         """Send command to request fresh MPPT data."""
         try:
             if not self._client or not self._client.is_connected:
                 return False
                 
-            # Find the write characteristic
-            write_char_uuid = WRITE_CHARACTERISTIC_UUID
-            write_char = None
-            for service in self._client.services:
-                for char in service.characteristics:
-                    if char.uuid.lower() == write_char_uuid.lower():
-                        write_char = char
-                        break
-                if write_char:
-                    break
-            
-            if write_char:
-                # Send the main real-time data command
-                cmd = bytes.fromhex(CONTROLLER_REALDATA_CMD)
-                await self._client.write_gatt_char(write_char, cmd)
+            # Write characteristic is resolved once per connection
+            if self._write_char:
+                # Send the command known to trigger data, or the main real-time data command
+                cmd = _COMMAND_BYTES[self._trigger_command or CONTROLLER_REALDATA_CMD]
+                # Clear before writing: the reply can arrive while the write is still being awaited
                 self._notification_received.clear()
+                # Shield the write so a cancelled update can't abort it mid-flight and upset the link
+                await asyncio.shield(self._client.write_gatt_char(self._write_char, cmd))
                 return True
             else:
                 _LOGGER.debug("Write characteristic not found for periodic command")
@@ -193,17 +338,36 @@ class MPPTBLECoordinator(DataUpdateCoordinator):
                 self._notification_received.set()
                 return
             
+            # The device often repeats the same frame; skip the parse, but still refresh the
+            # Bluetooth diagnostics, which change independently of the readings
+            if data == self._last_raw:
+                if self._latest_data is not None:
+                    refreshed_data = {**self._latest_data, **self._get_bluetooth_diagnostics()}
+                    if refreshed_data != self._latest_data:
+                        self._latest_data = refreshed_data
+                        self._schedule_dispatch()
+                self._notification_received.set()
+                return
+            
             # Parse the full MPPT data notification (logging happens inside parse_mppt_packet)
+            # unpack_from reads Bleak's bytearray in place, so no conversion is needed to parse;
+            # the one copy kept is the snapshot for the repeat check, as Bleak may reuse the buffer
             parsed_data = parse_mppt_packet(data)
+            self._last_raw = bytes(data)
             
             # Add Bluetooth diagnostic information
             parsed_data.update(self._get_bluetooth_diagnostics())
             
+            # Values unchanged (only bytes the parser ignores differed); don't wake every sensor
+            if parsed_data == self._latest_data:
+                self._notification_received.set()
+                return
+            
             self._latest_data = parsed_data
             self._notification_received.set()
             
-            # Update the coordinator data immediately
-            self.async_set_updated_data(parsed_data)
+            # Update the coordinator data, coalescing devices that stream faster than once a second
+            self._schedule_dispatch()
             
         except Exception as e:
             _LOGGER.error("Error parsing notification data: %s", e)
@@ -214,49 +378,92 @@ class MPPTBLECoordinator(DataUpdateCoordinator):
         _LOGGER.debug("Starting notification setup for device %s", self._mac_address)
         
         try:
-            # Get the Bluetooth device
-            ble_device = bluetooth.async_ble_device_from_address(
-                self.hass, self._mac_address, connectable=True
-            )
-            
-            if not ble_device:
-                _LOGGER.warning("BLE device %s not found or not connectable", self._mac_address)
-                raise UpdateFailed(f"Device {self._mac_address} not found")
-
-            # If we already have a client connected, check if it's still connected
+            # Fast path: the connection persists across updates, so just ask for fresh data.
+            # A single missed response is not worth a reconnect, but a device that keeps
+            # ignoring commands on a live link is reconnected so stale data doesn't linger.
             if self._client and self._client.is_connected:
                 _LOGGER.debug("Client already connected, sending periodic command for fresh data")
                 # Send periodic command to trigger fresh data
                 await self._send_data_request_command()
                 # Wait for response
                 try:
-                    await asyncio.wait_for(self._notification_received.wait(), timeout=5.0)
+                    await asyncio.wait_for(self._notification_received.wait(), timeout=RESPONSE_TIMEOUT)
+                    self._missed_responses = 0
                     return self._latest_data
                 except asyncio.TimeoutError:
-                    _LOGGER.warning("No notifications received after command, will reconnect")
+                    if self._data_char_uuid:
+                        parsed_data = await self._read_data_characteristic()
+                        if parsed_data:
+                            self._missed_responses = 0
+                            return parsed_data
+                
+                self._missed_responses += 1
+                if self._missed_responses < MAX_MISSED_RESPONSES:
+                    _LOGGER.warning("No notifications received after command, keeping connection open")
+                    return self._latest_data
+                
+                _LOGGER.warning("No response to %d commands in a row, reconnecting to %s", self._missed_responses, self._mac_address)
+                self._missed_responses = 0
+
+            # Get the Bluetooth device (an in-memory lookup, so it runs on every update)
+            ble_device = bluetooth.async_ble_device_from_address(
+                self.hass, self._mac_address, connectable=True
+            )
+            
+            if not ble_device:
+                _LOGGER.warning("BLE device %s not found or not connectable", self._mac_address)
+                self._device_missing = True
+                raise UpdateFailed(f"Device {self._mac_address} not found")
+            
+            # The device is advertising again; connect right away instead of waiting out the backoff
+            if self._device_missing:
+                self._device_missing = False
+                self._reconnect_backoff = 0.0
+                self._connect_skips = 0
+
+            # Back off after failed connection attempts instead of retrying on every update
+            if self._connect_skips:
+                self._connect_skips -= 1
+                _LOGGER.debug("Backing off, skipping connection attempt to %s", self._mac_address)
+                return None
 
             _LOGGER.debug("Connecting to device %s", self._mac_address)
             
             # Create new client with better timeout handling
             try:
-                # Clean up any existing client first
+                # Clean up any existing client first (detached first so its disconnect isn't seen as a drop)
                 if self._client:
+                    client, self._client = self._client, None
+                    self._notify_char = None
+                    self._write_char = None
                     try:
-                        await self._client.disconnect()
+                        await client.disconnect()
                     except:
                         pass
-                    self._client = None
                 
-                self._client = BleakClient(ble_device, timeout=CONNECTION_TIMEOUT)
+                self._client = BleakClient(
+                    ble_device,
+                    disconnected_callback=self._handle_disconnect,
+                    timeout=CONNECTION_TIMEOUT,
+                )
                 _LOGGER.debug("Created BleakClient, attempting connection...")
                 
                 # Use asyncio.wait_for for better timeout control
                 await asyncio.wait_for(self._client.connect(), timeout=CONNECTION_TIMEOUT)
                 _LOGGER.info("Connected to MPPT device %s", self._mac_address)
+                connected_client = self._client
+                self._reconnect_backoff = 0.0
+                self._missed_responses = 0
+                
+                # Only data received on this connection counts towards the trigger probe below
+                self._cancel_dispatch()
+                self._latest_data = None
+                self._last_raw = None
                 
             except asyncio.TimeoutError:
                 _LOGGER.warning("Connection timeout to device %s - will retry later", self._mac_address)
                 self._client = None
+                self._back_off_reconnect()
                 # Don't raise error, just return None to keep trying
                 return None
             except asyncio.CancelledError:
@@ -266,33 +473,41 @@ class MPPTBLECoordinator(DataUpdateCoordinator):
             except Exception as e:
                 _LOGGER.warning("Failed to connect to device %s: %s", self._mac_address, e)
                 self._client = None
+                self._back_off_reconnect()
                 # Don't raise error, just return None to keep trying
                 return None
             
             # Discover services
             services = self._client.services
-            service_count = len(list(services))
+            service_count = len(services.services)
             _LOGGER.info("Discovered %d services", service_count)
             
             # Log all services for debugging
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                for service in services:
+                    _LOGGER.debug("Service: %s", service.uuid)
+                    for char in service.characteristics:
+                        _LOGGER.debug("  Characteristic: %s - Properties: %s",
+                                    char.uuid, char.properties)
+            
+            # Resolve the notify/write characteristics once and keep them for this connection.
+            # First match wins, in a single pass; get_characteristic() would raise if a UUID
+            # appeared in more than one service.
+            notify_uuid = NOTIFY_CHARACTERISTIC_UUID.lower()
+            write_uuid = WRITE_CHARACTERISTIC_UUID.lower()
+            self._notify_char = None
+            self._write_char = None
             for service in services:
-                _LOGGER.debug("Service: %s", service.uuid)
                 for char in service.characteristics:
-                    _LOGGER.debug("  Characteristic: %s - Properties: %s", 
-                                char.uuid, char.properties)
+                    char_uuid = char.uuid.lower()
+                    if self._notify_char is None and char_uuid == notify_uuid:
+                        self._notify_char = char
+                    if self._write_char is None and char_uuid == write_uuid:
+                        self._write_char = char
             
             # Find the notification characteristic from constants
             target_char_uuid = NOTIFY_CHARACTERISTIC_UUID
-            
-            # Find the notification characteristic
-            target_char = None
-            for service in services:
-                for char in service.characteristics:
-                    if char.uuid.lower() == target_char_uuid.lower():
-                        target_char = char
-                        break
-                if target_char:
-                    break
+            target_char = self._notify_char
             
             if not target_char:
                 _LOGGER.error("Could not find notification characteristic %s", target_char_uuid)
@@ -306,38 +521,34 @@ class MPPTBLECoordinator(DataUpdateCoordinator):
             
             # Since the Android app gets data, we need to find the right trigger
             # Let's try writing to the write characteristic with different commands
-            write_char_uuid = WRITE_CHARACTERISTIC_UUID
-            write_char = None
-            for service in services:
-                for char in service.characteristics:
-                    if char.uuid.lower() == write_char_uuid.lower():
-                        write_char = char
-                        break
-                if write_char:
-                    break
+            write_char = self._write_char
             
             if write_char:
                 _LOGGER.info("Found write characteristic, trying different trigger commands...")
                 
                 # Use the exact commands from the Android app JavaScript
-                trigger_commands = [
-                    bytes.fromhex(CONTROLLER_REALDATA_CMD),  # ControllerRealdata - main real-time data command
-                    bytes.fromhex(CONTROLLER_REALDATA_WITH_CRC_CMD),  # Complete command with CRC
-                    bytes.fromhex(NEW_DEVICE_REALDATA_CMD),  # NewDeviceRealdata
-                    bytes.fromhex(OLD_DEVICE_REALDATA_CMD),  # OldDeviceRealdata
-                ]
+                trigger_commands = list(TRIGGER_COMMANDS)
                 
-                for i, cmd in enumerate(trigger_commands):
+                # Try the command that worked last time first; the rest are only a fallback
+                if self._trigger_command in trigger_commands:
+                    trigger_commands.remove(self._trigger_command)
+                    trigger_commands.insert(0, self._trigger_command)
+                
+                for i, cmd_hex in enumerate(trigger_commands):
+                    cmd = _COMMAND_BYTES[cmd_hex]
                     try:
                         _LOGGER.info("Sending trigger command %d: %s", i+1, cmd.hex())
+                        # Clear before writing so a fast reply isn't wiped out
+                        self._notification_received.clear()
                         await self._client.write_gatt_char(write_char, cmd)
                         
                         # Wait for response after each command
-                        self._notification_received.clear()
                         try:
                             await asyncio.wait_for(self._notification_received.wait(), timeout=RESPONSE_TIMEOUT)
                             if self._latest_data:
                                 _LOGGER.info("SUCCESS! Command %d triggered MPPT data", i+1)
+                                self._trigger_command = cmd_hex
+                                self._store_entry_value(CONF_TRIGGER_COMMAND, cmd_hex)
                                 return self._latest_data
                         except asyncio.TimeoutError:
                             _LOGGER.debug("Command %d: no response", i+1)
@@ -347,6 +558,18 @@ class MPPTBLECoordinator(DataUpdateCoordinator):
                         _LOGGER.debug("Failed to send command %d: %s", i+1, e)
                         continue
             
+            # A previous probe found the data in a readable characteristic; read only that one
+            if self._data_char_uuid:
+                parsed_data = await self._read_data_characteristic()
+                if parsed_data:
+                    return parsed_data
+            
+            # The probe below costs a GATT read per characteristic plus a long wait,
+            # so it only ever runs once per device
+            if self._probed_once:
+                _LOGGER.warning("Could not retrieve MPPT data despite device being active")
+                return None
+            
             # Try reading from all readable characteristics to see if any contain data
             _LOGGER.info("Trying to read from all readable characteristics...")
             for service in services:
@@ -354,12 +577,16 @@ class MPPTBLECoordinator(DataUpdateCoordinator):
                     if "read" in char.properties:
                         try:
                             data = await self._client.read_gatt_char(char)
-                            _LOGGER.info("Read %d bytes from %s: %s", len(data), char.uuid, data.hex())
+                            if _LOGGER.isEnabledFor(logging.INFO):
+                                _LOGGER.info("Read %d bytes from %s: %s", len(data), char.uuid, data.hex())
                             
                             if len(data) >= 23:
                                 try:
                                     parsed_data = parse_mppt_packet(data)
                                     _LOGGER.info("SUCCESS! Found MPPT data in characteristic %s: %s", char.uuid, parsed_data)
+                                    self._data_char_uuid = char.uuid
+                                    self._store_entry_value(CONF_DATA_CHARACTERISTIC, char.uuid)
+                                    self._mark_probed()
                                     self._latest_data = parsed_data
                                     self.async_set_updated_data(parsed_data)
                                     return parsed_data
@@ -376,10 +603,18 @@ class MPPTBLECoordinator(DataUpdateCoordinator):
                 await asyncio.wait_for(self._notification_received.wait(), timeout=30.0)
                 if self._latest_data:
                     _LOGGER.info("Received MPPT data via notifications")
+                    self._mark_probed()
                     return self._latest_data
             except asyncio.TimeoutError:
                 pass
             
+            # Only recorded once the probe has run to the end on a link that stayed up, so a probe
+            # interrupted by a cancelled update or a dropped connection is retried
+            if connected_client is not self._client or not connected_client.is_connected:
+                _LOGGER.debug("Connection to %s dropped during the probe, will retry it", self._mac_address)
+                return None
+            
+            self._mark_probed()
             _LOGGER.warning("Could not retrieve MPPT data despite device being active")
             _LOGGER.info("Connection will stay alive for future attempts")
             return None
@@ -387,29 +622,36 @@ class MPPTBLECoordinator(DataUpdateCoordinator):
         except BleakError as e:
             _LOGGER.error("Bluetooth connection error: %s", e)
             if self._client:
+                client, self._client = self._client, None
+                self._notify_char = None
+                self._write_char = None
                 try:
-                    await self._client.disconnect()
+                    await client.disconnect()
                 except:
                     pass
-                self._client = None
             raise UpdateFailed(f"Connection failed: {e}")
         except Exception as e:
             _LOGGER.error("Unexpected error: %s", e, exc_info=True)
             if self._client:
+                client, self._client = self._client, None
+                self._notify_char = None
+                self._write_char = None
                 try:
-                    await self._client.disconnect()
+                    await client.disconnect()
                 except:
                     pass
-                self._client = None
             raise UpdateFailed(f"Update failed: {e}")
 
     async def async_shutdown(self):
         """Shutdown the coordinator and disconnect."""
+        self._cancel_dispatch()
+        
         if self._client and self._client.is_connected:
+            client, self._client = self._client, None
+            self._notify_char = None
+            self._write_char = None
             try:
-                await self._client.disconnect()
+                await client.disconnect()
                 _LOGGER.info("Disconnected from MPPT device")
             except Exception as e:
                 _LOGGER.debug("Error during shutdown disconnect: %s", e)
-            finally:
-                self._client = None
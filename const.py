@@ -5,6 +5,9 @@ DOMAIN = "vevor_mppt_bluetooth"
 # Configuration keys
 CONF_NAME = "name"
 CONF_MAC_ADDRESS = "mac_address"
+CONF_TRIGGER_COMMAND = "trigger_command"  # Learned command that makes the device send data
+CONF_FALLBACK_PROBED = "fallback_probed"  # Whether the one-time characteristic probe has run
+CONF_DATA_CHARACTERISTIC = "data_characteristic"  # Readable characteristic the probe found data in
 
 # Default values
 DEFAULT_NAME = "VEVOR MPPT"
@@ -21,8 +24,24 @@ CONTROLLER_REALDATA_WITH_CRC_CMD = "FF03010000231031"
 NEW_DEVICE_REALDATA_CMD = "FF0300FD000D"
 OLD_DEVICE_REALDATA_CMD = "FF030100000A"
 
+# Commands tried, in order, to make the device start sending data
+TRIGGER_COMMANDS = (
+    CONTROLLER_REALDATA_CMD,  # ControllerRealdata - main real-time data command
+    CONTROLLER_REALDATA_WITH_CRC_CMD,  # Complete command with CRC
+    NEW_DEVICE_REALDATA_CMD,  # NewDeviceRealdata
+    OLD_DEVICE_REALDATA_CMD,  # OldDeviceRealdata
+)
+
 # Data parsing constants
 MIN_DATA_LENGTH = 46  # Minimum bytes needed for full MPPT data
 RESPONSE_TIMEOUT = 5.0  # Seconds to wait for command response
+MAX_MISSED_RESPONSES = 3  # Unanswered commands in a row before reconnecting
 CONNECTION_TIMEOUT = 10.0  # Seconds to wait for Bluetooth connection
-UPDATE_INTERVAL = 60  # Seconds between coordinator updates
\ No newline at end of file
+UPDATE_INTERVAL = 60  # Seconds between coordinator updates
+DISPATCH_MIN_INTERVAL = 1.0  # Minimum seconds between pushing notification data to sensors
+RECONNECT_BACKOFF_INITIAL = 15.0  # Seconds of backoff after the first failed connection attempt
+RECONNECT_BACKOFF_MAX = 60.0  # Cap on the backoff between failed connection attempts
+
+# Bluetooth diagnostics
+RSSI_EMA_ALPHA = 0.2  # Weight of the newest RSSI sample in the link quality moving average
+DIAGNOSTICS_CACHE_TTL = 5.0  # Seconds to reuse the last RSSI lookup
\ No newline at end of file
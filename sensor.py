@@ -4,6 +4,7 @@ from __future__ import annotations
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.helpers.entity import EntityCategory
@@ -27,6 +28,163 @@ import logging
 
 _LOGGER = logging.getLogger(__name__)
 
+SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
+    # Basic MPPT sensors
+    SensorEntityDescription(
+        key="solar_voltage",
+        name="Solar Voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+    ),
+    SensorEntityDescription(
+        key="solar_current",
+        name="Solar Current",
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+    ),
+    SensorEntityDescription(
+        key="solar_power",
+        name="Solar Power",
+        native_unit_of_measurement=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+    ),
+    SensorEntityDescription(
+        key="battery_voltage",
+        name="Battery Voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+    ),
+    SensorEntityDescription(
+        key="battery_current",
+        name="Battery Current",
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+    ),
+    SensorEntityDescription(
+        key="battery_temperature",
+        name="Battery Temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+    ),
+
+    # Load/output sensors
+    SensorEntityDescription(
+        key="load_voltage",
+        name="Load Voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+    ),
+    SensorEntityDescription(
+        key="load_current",
+        name="Load Current",
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+    ),
+    SensorEntityDescription(
+        key="load_power",
+        name="Load Power",
+        native_unit_of_measurement=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+    ),
+
+    # Energy statistics sensors
+    SensorEntityDescription(
+        key="daily_energy",
+        name="Daily Energy",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+    ),
+    SensorEntityDescription(
+        key="total_energy",
+        name="Total Energy",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+    ),
+
+    # Maximum value sensors
+    SensorEntityDescription(
+        key="max_solar_voltage",
+        name="Max Solar Voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+    ),
+    SensorEntityDescription(
+        key="max_battery_voltage",
+        name="Max Battery Voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+    ),
+    SensorEntityDescription(
+        key="max_charging_current",
+        name="Max Charging Current",
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+    ),
+
+    # Status sensors (no device class for these)
+    SensorEntityDescription(
+        key="charging_state",
+        name="Charging State",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+    ),
+    SensorEntityDescription(
+        key="error_code",
+        name="Error Code",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+    ),
+)
+
+# Bluetooth diagnostic sensors
+DIAGNOSTIC_SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
+    SensorEntityDescription(
+        key="link_quality",
+        name="Link Quality",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorEntityDescription(
+        key="signal_strength",
+        name="Signal Strength",
+        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -41,36 +199,10 @@ async def async_setup_entry(
     # Store coordinator in hass data
     hass.data[DOMAIN][config_entry.entry_id] = coordinator
     
-    sensors = [
-        # Basic MPPT sensors
-        MPPTSensor(coordinator, config_entry, "solar_voltage", "Solar Voltage", UnitOfElectricPotential.VOLT, SensorDeviceClass.VOLTAGE, 2),
-        MPPTSensor(coordinator, config_entry, "solar_current", "Solar Current", UnitOfElectricCurrent.AMPERE, SensorDeviceClass.CURRENT, 2),
-        MPPTSensor(coordinator, config_entry, "solar_power", "Solar Power", UnitOfPower.WATT, SensorDeviceClass.POWER, 0),
-        MPPTSensor(coordinator, config_entry, "battery_voltage", "Battery Voltage", UnitOfElectricPotential.VOLT, SensorDeviceClass.VOLTAGE, 2),
-        MPPTSensor(coordinator, config_entry, "battery_current", "Battery Current", UnitOfElectricCurrent.AMPERE, SensorDeviceClass.CURRENT, 2),
-        MPPTSensor(coordinator, config_entry, "battery_temperature", "Battery Temperature", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE, 1),
-        
-        # Load/output sensors
-        MPPTSensor(coordinator, config_entry, "load_voltage", "Load Voltage", UnitOfElectricPotential.VOLT, SensorDeviceClass.VOLTAGE, 2),
-        MPPTSensor(coordinator, config_entry, "load_current", "Load Current", UnitOfElectricCurrent.AMPERE, SensorDeviceClass.CURRENT, 2),
-        MPPTSensor(coordinator, config_entry, "load_power", "Load Power", UnitOfPower.WATT, SensorDeviceClass.POWER, 0),
-        
-        # Energy statistics sensors
-        MPPTSensor(coordinator, config_entry, "daily_energy", "Daily Energy", UnitOfEnergy.KILO_WATT_HOUR, SensorDeviceClass.ENERGY, 2),
-        MPPTSensor(coordinator, config_entry, "total_energy", "Total Energy", UnitOfEnergy.KILO_WATT_HOUR, SensorDeviceClass.ENERGY, 2),
-        
-        # Maximum value sensors
-        MPPTSensor(coordinator, config_entry, "max_solar_voltage", "Max Solar Voltage", UnitOfElectricPotential.VOLT, SensorDeviceClass.VOLTAGE, 2),
-        MPPTSensor(coordinator, config_entry, "max_battery_voltage", "Max Battery Voltage", UnitOfElectricPotential.VOLT, SensorDeviceClass.VOLTAGE, 2),
-        MPPTSensor(coordinator, config_entry, "max_charging_current", "Max Charging Current", UnitOfElectricCurrent.AMPERE, SensorDeviceClass.CURRENT, 2),
-        
-        # Status sensors (no device class for these)
-        MPPTSensor(coordinator, config_entry, "charging_state", "Charging State", None, None, 0),
-        MPPTSensor(coordinator, config_entry, "error_code", "Error Code", None, None, 0),
-        
-        # Bluetooth diagnostic sensors
-        MPPTDiagnosticSensor(coordinator, config_entry, "link_quality", "Link Quality", PERCENTAGE, 0),
-        MPPTDiagnosticSensor(coordinator, config_entry, "signal_strength", "Signal Strength", SIGNAL_STRENGTH_DECIBELS_MILLIWATT, 0, SensorDeviceClass.SIGNAL_STRENGTH),
+    sensors = [MPPTSensor(coordinator, config_entry, description) for description in SENSOR_DESCRIPTIONS]
+    sensors += [
+        MPPTDiagnosticSensor(coordinator, config_entry, description)
+        for description in DIAGNOSTIC_SENSOR_DESCRIPTIONS
     ]
     
     _LOGGER.info("Created %d MPPT sensors", len(sensors))
@@ -78,111 +210,56 @@ async def async_setup_entry(
     _LOGGER.info("VEVOR MPPT Bluetooth sensors setup completed")
 
 
-class MPPTSensor(CoordinatorEntity, SensorEntity):
-    """Representation of a VEVOR MPPT sensor."""
+class MPPTBaseSensor(CoordinatorEntity, SensorEntity):
+    """Common behaviour of the VEVOR MPPT sensors."""
+
+    _attr_has_entity_name = True  # Friendly name is prefixed with the device name
 
     def __init__(
         self,
         coordinator: MPPTBLECoordinator,
         config_entry: ConfigEntry,
-        sensor_key: str,
-        name: str,
-        unit: str,
-        device_class: SensorDeviceClass,
-        precision: int = None,
+        description: SensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._sensor_key = sensor_key
-        self._attr_name = f"{config_entry.data['name']} {name}"
-        self._attr_unique_id = f"{config_entry.entry_id}_{sensor_key}"
-        self._attr_native_unit_of_measurement = unit
-        self._attr_device_class = device_class
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        if precision is not None:
-            self._attr_suggested_display_precision = precision
-        self._config_entry = config_entry
+        self.entity_description = description
+        self._sensor_key = description.key
+        self._attr_unique_id = f"{config_entry.entry_id}_{description.key}"
+        self._attr_device_info = coordinator.device_info
+        self._update_from_data()
 
-    @property
-    def device_info(self):
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._config_entry.entry_id)},
-            "name": self._config_entry.data["name"],
-            "manufacturer": "VEVOR",
-            "model": "MPPT Bluetooth Charger",
-            "connections": {("mac", self._config_entry.data["mac_address"])},
-        }
-
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        if self.coordinator.data:
-            return self.coordinator.data.get(self._sensor_key)
-        return None
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
+    def _is_available(self) -> bool:
+        """Return if the coordinator data makes this sensor available."""
         return self.coordinator.data is not None
 
+    def _update_from_data(self) -> None:
+        """Cache the state and availability from the current coordinator data."""
+        data = self.coordinator.data
+        self._attr_native_value = data.get(self._sensor_key) if data else None
+        self._attr_available = self._is_available()
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
+        self._update_from_data()
+        super()._handle_coordinator_update()
 
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        # CoordinatorEntity.available only reports last_update_success, so the cached flag is checked here
+        return super().available and self._attr_available
 
-class MPPTDiagnosticSensor(CoordinatorEntity, SensorEntity):
-    """Representation of a VEVOR MPPT diagnostic sensor."""
-
-    def __init__(
-        self,
-        coordinator: MPPTBLECoordinator,
-        config_entry: ConfigEntry,
-        sensor_key: str,
-        name: str,
-        unit: str,
-        precision: int = None,
-        device_class: SensorDeviceClass | None = None,
-    ) -> None:
-        """Initialize the diagnostic sensor."""
-        super().__init__(coordinator)
-        self._sensor_key = sensor_key
-        self._attr_name = f"{config_entry.data['name']} {name}"
-        self._attr_unique_id = f"{config_entry.entry_id}_{sensor_key}"
-        self._attr_native_unit_of_measurement = unit
-        if device_class is not None:
-            self._attr_device_class = device_class
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC  # Mark as diagnostic entity
-        if precision is not None:
-            self._attr_suggested_display_precision = precision
-        self._config_entry = config_entry
 
-    @property
-    def device_info(self):
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._config_entry.entry_id)},
-            "name": self._config_entry.data["name"],
-            "manufacturer": "VEVOR",
-            "model": "MPPT Bluetooth Charger",
-            "connections": {("mac", self._config_entry.data["mac_address"])},
-        }
+class MPPTSensor(MPPTBaseSensor):
+    """Representation of a VEVOR MPPT sensor."""
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        if self.coordinator.data:
-            return self.coordinator.data.get(self._sensor_key)
-        return None
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.data is not None and self.coordinator.data.get(self._sensor_key) is not None
+class MPPTDiagnosticSensor(MPPTBaseSensor):
+    """Representation of a VEVOR MPPT diagnostic sensor."""
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
+    def _is_available(self) -> bool:
+        """Return if the coordinator data makes this sensor available."""
+        # Bluetooth diagnostics can be missing even when the device reported data
+        return super()._is_available() and self.coordinator.data.get(self._sensor_key) is not None